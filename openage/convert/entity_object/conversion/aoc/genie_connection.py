@@ -16,12 +16,88 @@ if typing.TYPE_CHECKING:
     from openage.convert.value_object.read.value_members import ValueMember
 
 
-class GenieAgeConnection(ConverterObject):
+class GenieConnection(ConverterObject):
+    """
+    A relation between a Genie object and other buildings/techs/units in AoE.
+    """
+
+    __slots__ = ('data', '_connection_indices')
+
+    def __init__(
+        self,
+        connection_id: int,
+        full_data_set: GenieObjectContainer,
+        members: dict[str, ValueMember] = None
+    ):
+        """
+        Creates a new Genie connection.
+
+        :param connection_id: The id of the connected object from the .dat file.
+        :param full_data_set: GenieObjectContainer instance that
+                              contains all relevant data for the conversion
+                              process.
+        :param members: An already existing member dict.
+        """
+
+        super().__init__(connection_id, members=members)
+
+        self.data = full_data_set
+
+        # Indices in other_connections sorted by connection type;
+        # created on first access
+        self._connection_indices: dict[int, tuple[int, ...]] = None
+
+    def get_connection_indices(self, connection_type: int) -> tuple[int, ...]:
+        """
+        Returns the indices of the entries in other_connections that
+        have the specified connection type.
+
+        :param connection_type: Type of the connected object
+                                (0 = Age, 1 = Building, 2 = Unit, 3 = Tech).
+        :type connection_type: int
+        :returns: Indices of the matching connections in ascending order.
+        :rtype: tuple
+        """
+        if self._connection_indices is None:
+            connection_indices = {}
+            connected_types = self["other_connections"].value
+            for index, connected_type in enumerate(connected_types):
+                type_id = connected_type["other_connection"].value
+                connection_indices.setdefault(type_id, []).append(index)
+
+            self._connection_indices = {
+                type_id: tuple(indices) for type_id, indices in connection_indices.items()
+            }
+
+        return self._connection_indices.get(connection_type, ())
+
+    def get_first_connection_index(self, connection_type: int) -> int:
+        """
+        Returns the index of the first entry in other_connections that
+        has the specified connection type.
+
+        :param connection_type: Type of the connected object
+                                (0 = Age, 1 = Building, 2 = Unit, 3 = Tech).
+        :type connection_type: int
+        :returns: Index of the first matching connection or -1 if there is none.
+        :rtype: int
+        """
+        connection_indices = self.get_connection_indices(connection_type)
+        if connection_indices:
+            return connection_indices[0]
+
+        return -1
+
+    def __repr__(self):
+        return f"GenieConnection<{self.get_id()}>"
+
+
+class GenieAgeConnection(GenieConnection):
     """
     A relation between an Age and buildings/techs/units in AoE.
     """
 
-    __slots__ = ('data',)
+    __slots__ = ()
 
     def __init__(
         self,
@@ -39,20 +115,18 @@ class GenieAgeConnection(ConverterObject):
         :param members: An already existing member dict.
         """
 
-        super().__init__(age_id, members=members)
-
-        self.data = full_data_set
+        super().__init__(age_id, full_data_set, members=members)
 
     def __repr__(self):
         return f"GenieAgeConnection<{self.get_id()}>"
 
 
-class GenieBuildingConnection(ConverterObject):
+class GenieBuildingConnection(GenieConnection):
     """
     A relation between a building and other buildings/techs/units in AoE.
     """
 
-    __slots__ = ('data',)
+    __slots__ = ()
 
     def __init__(
         self,
@@ -70,20 +144,18 @@ class GenieBuildingConnection(ConverterObject):
         :param members: An already existing member dict.
         """
 
-        super().__init__(building_id, members=members)
-
-        self.data = full_data_set
+        super().__init__(building_id, full_data_set, members=members)
 
     def __repr__(self):
         return f"GenieBuildingConnection<{self.get_id()}>"
 
 
-class GenieTechConnection(ConverterObject):
+class GenieTechConnection(GenieConnection):
     """
     A relation between a tech and other buildings/techs/units in AoE.
     """
 
-    __slots__ = ('data',)
+    __slots__ = ()
 
     def __init__(
         self,
@@ -101,20 +173,18 @@ class GenieTechConnection(ConverterObject):
         :param members: An already existing member dict.
         """
 
-        super().__init__(tech_id, members=members)
-
-        self.data = full_data_set
+        super().__init__(tech_id, full_data_set, members=members)
 
     def __repr__(self):
         return f"GenieTechConnection<{self.get_id()}>"
 
 
-class GenieUnitConnection(ConverterObject):
+class GenieUnitConnection(GenieConnection):
     """
     A relation between a unit and other buildings/techs/units in AoE.
     """
 
-    __slots__ = ('data',)
+    __slots__ = ()
 
     def __init__(
         self,
@@ -132,9 +202,7 @@ class GenieUnitConnection(ConverterObject):
         :param members: An already existing member dict.
         """
 
-        super().__init__(unit_id, members=members)
-
-        self.data = full_data_set
+        super().__init__(unit_id, full_data_set, members=members)
 
     def __repr__(self):
         return f"GenieUnitConnection<{self.get_id()}>"
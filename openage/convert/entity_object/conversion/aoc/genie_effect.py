@@ -61,7 +61,7 @@ class GenieEffectBundle(ConverterObject):
     A set of effects of a tech.
     """
 
-    __slots__ = ('effects', 'sanitized', 'data')
+    __slots__ = ('_effects', '_effects_by_type', 'sanitized', 'data')
 
     def __init__(
         self,
@@ -105,14 +105,31 @@ class GenieEffectBundle(ConverterObject):
         :rtype: list
         """
         if effect_type:
-            matching_effects = []
-            for effect in self.effects.values():
-                if effect.get_type() == effect_type:
-                    matching_effects.append(effect)
+            if self._effects_by_type is None:
+                self._effects_by_type = {}
+                for effect in self._effects:
+                    self._effects_by_type.setdefault(effect.get_type(), []).append(effect)
 
-            return matching_effects
+            return list(self._effects_by_type.get(effect_type, ()))
 
-        return list(self.effects.values())
+        return list(self._effects)
+
+    @property
+    def effects(self) -> list[GenieEffectObject]:
+        """
+        Returns the effects of the bundle.
+        """
+        return self._effects
+
+    @effects.setter
+    def effects(self, effects: list[GenieEffectObject]) -> None:
+        """
+        Replaces the effects of the bundle.
+        """
+        self._effects = effects
+
+        # Effects sorted by type; created on the first lookup by type
+        self._effects_by_type: dict[int, list[GenieEffectObject]] = None
 
     def is_sanitized(self) -> bool:
         """
@@ -64,16 +64,16 @@ class GenieGraphic(ConverterObject):
         Add references for the direct subgraphics to this object.
         """
         graphic_deltas = self["graphic_deltas"].value
+        genie_graphics = self.data.genie_graphics
 
         for subgraphic in graphic_deltas:
             graphic_id = subgraphic["graphic_id"].value
+            graphic = genie_graphics.get(graphic_id)
 
             # Ignore invalid IDs
-            if graphic_id not in self.data.genie_graphics.keys():
+            if graphic is None:
                 continue
 
-            graphic = self.data.genie_graphics[graphic_id]
-
             self.subgraphics.append(graphic)
             graphic.add_reference(self)
 
@@ -192,7 +192,7 @@ class GenieGameEntityGroup(ConverterObjectGroup):
         """
         Returns True if a entity with unit_id is part of the line.
         """
-        return unit_id in self.line_positions.keys()
+        return unit_id in self.line_positions
 
     def contains_researchable(self, line_id: int) -> bool:
         """
@@ -672,6 +672,14 @@ class GenieBuildingLineGroup(GenieGameEntityGroup):
         """
         self.gatherer_ids.add(unit_id)
 
+    def add_gatherer_ids(self, unit_ids: typing.Iterable[int]) -> None:
+        """
+        Adds Ids of gatherers that drop off resources at this building.
+
+        :param unit_ids: IDs of the gatherers.
+        """
+        self.gatherer_ids.update(unit_ids)
+
     def add_trading_line(self, unit_line: GenieGameEntityGroup) -> None:
         """
         Adds a reference to a line that trades with this building.
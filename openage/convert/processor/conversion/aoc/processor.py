@@ -7,7 +7,7 @@ Convert data from AoC to openage formats.
 """
 from __future__ import annotations
 import typing
-
+from itertools import chain
 
 from .....log import info
 from ....entity_object.conversion.aoc.genie_civ import GenieCivilizationGroup
@@ -122,6 +122,11 @@ class AoCProcessor:
 
         info("Extracting Genie data...")
 
+        # The extractors modify gamespec in place and must run in this order.
+        # extract_genie_units() replaces the attacks/armors members of the
+        # civ 0 units, which extract_genie_civs() then wraps for civ 0.
+        # extract_genie_effect_bundles() pops the effects from the raw
+        # bundles, and sanitize_effect_bundles() needs the extracted bundles.
         cls.extract_genie_units(gamespec, dataset)
         cls.extract_genie_techs(gamespec, dataset)
         cls.extract_genie_effect_bundles(gamespec, dataset)
@@ -213,27 +218,28 @@ class AoCProcessor:
         # Gaia also seems to have the most units, so we only read from Gaia
         #
         # call hierarchy: wrapper[0]->civs[0]->units
-        raw_units = gamespec[0]["civs"][0]["units"].value
+        wrapper = gamespec[0]
+        raw_units = wrapper["civs"][0]["units"].value
 
         # Unit headers store the things units can do
-        raw_unit_headers = gamespec[0]["unit_headers"].value
+        raw_unit_headers = wrapper["unit_headers"].value
 
         for raw_unit in raw_units:
-            unit_id = raw_unit["id0"].value
             unit_members = raw_unit.value
+            unit_id = unit_members["id0"].value
 
             # Turn attack and armor into containers to make diffing work
-            if "attacks" in unit_members.keys():
+            if "attacks" in unit_members:
                 attacks_member = unit_members.pop("attacks")
                 attacks_member = attacks_member.get_container("type_id")
                 armors_member = unit_members.pop("armors")
                 armors_member = armors_member.get_container("type_id")
 
-                unit_members.update({"attacks": attacks_member})
-                unit_members.update({"armors": armors_member})
+                unit_members["attacks"] = attacks_member
+                unit_members["armors"] = armors_member
 
             unit = GenieUnitObject(unit_id, full_data_set, members=unit_members)
-            full_data_set.genie_units.update({unit.get_id(): unit})
+            full_data_set.genie_units[unit.get_id()] = unit
 
             # Commands
             unit_commands = raw_unit_headers[unit_id]["unit_commands"]
@@ -252,15 +258,11 @@ class AoCProcessor:
         # call hierarchy: wrapper[0]->researches
         raw_techs = gamespec[0]["researches"].value
 
-        index = 0
-        for raw_tech in raw_techs:
-            tech_id = index
+        for tech_id, raw_tech in enumerate(raw_techs):
             tech_members = raw_tech.value
 
             tech = GenieTechObject(tech_id, full_data_set, members=tech_members)
-            full_data_set.genie_techs.update({tech.get_id(): tech})
-
-            index += 1
+            full_data_set.genie_techs[tech.get_id()] = tech
 
     @staticmethod
     def extract_genie_effect_bundles(
@@ -276,37 +278,23 @@ class AoCProcessor:
         # call hierarchy: wrapper[0]->effect_bundles
         raw_effect_bundles = gamespec[0]["effect_bundles"].value
 
-        index_bundle = 0
-        for raw_effect_bundle in raw_effect_bundles:
-            bundle_id = index_bundle
-
+        for bundle_id, raw_effect_bundle in enumerate(raw_effect_bundles):
             # call hierarchy: effect_bundle->effects
-            raw_effects = raw_effect_bundle["effects"].value
-
-            effects = {}
-
-            index_effect = 0
-            for raw_effect in raw_effects:
-                effect_id = index_effect
-                effect_members = raw_effect.value
-
-                effect = GenieEffectObject(effect_id, bundle_id, full_data_set,
-                                           members=effect_members)
-
-                effects.update({effect_id: effect})
-
-                index_effect += 1
-
-            # Pass everything to the bundle
             effect_bundle_members = raw_effect_bundle.value
+
             # Remove effects we store them as separate objects
-            effect_bundle_members.pop("effects")
+            raw_effects = effect_bundle_members.pop("effects").value
 
+            effects = [
+                GenieEffectObject(effect_id, bundle_id, full_data_set,
+                                  members=raw_effect.value)
+                for effect_id, raw_effect in enumerate(raw_effects)
+            ]
+
+            # Pass everything else to the bundle
             bundle = GenieEffectBundle(bundle_id, effects, full_data_set,
                                        members=effect_bundle_members)
-            full_data_set.genie_effect_bundles.update({bundle.get_id(): bundle})
-
-            index_bundle += 1
+            full_data_set.genie_effect_bundles[bundle.get_id()] = bundle
 
     @staticmethod
     def extract_genie_civs(
@@ -322,20 +310,15 @@ class AoCProcessor:
         # call hierarchy: wrapper[0]->civs
         raw_civs = gamespec[0]["civs"].value
 
-        index = 0
-        for raw_civ in raw_civs:
-            civ_id = index
-
+        for civ_id, raw_civ in enumerate(raw_civs):
             civ_members = raw_civ.value
             units_member = civ_members.pop("units")
             units_member = units_member.get_container("id0")
 
-            civ_members.update({"units": units_member})
+            civ_members["units"] = units_member
 
             civ = GenieCivilizationObject(civ_id, full_data_set, members=civ_members)
-            full_data_set.genie_civs.update({civ.get_id(): civ})
-
-            index += 1
+            full_data_set.genie_civs[civ.get_id()] = civ
 
     @staticmethod
     def extract_age_connections(gamespec: ArrayMember, full_data_set: GenieObjectContainer) -> None:
@@ -349,11 +332,11 @@ class AoCProcessor:
         raw_connections = gamespec[0]["age_connections"].value
 
         for raw_connection in raw_connections:
-            age_id = raw_connection["id"].value
             connection_members = raw_connection.value
+            age_id = connection_members["id"].value
 
             connection = GenieAgeConnection(age_id, full_data_set, members=connection_members)
-            full_data_set.age_connections.update({connection.get_id(): connection})
+            full_data_set.age_connections[connection.get_id()] = connection
 
     @staticmethod
     def extract_building_connections(
@@ -370,12 +353,12 @@ class AoCProcessor:
         raw_connections = gamespec[0]["building_connections"].value
 
         for raw_connection in raw_connections:
-            building_id = raw_connection["id"].value
             connection_members = raw_connection.value
+            building_id = connection_members["id"].value
 
             connection = GenieBuildingConnection(building_id, full_data_set,
                                                  members=connection_members)
-            full_data_set.building_connections.update({connection.get_id(): connection})
+            full_data_set.building_connections[connection.get_id()] = connection
 
     @staticmethod
     def extract_unit_connections(
@@ -392,11 +375,11 @@ class AoCProcessor:
         raw_connections = gamespec[0]["unit_connections"].value
 
         for raw_connection in raw_connections:
-            unit_id = raw_connection["id"].value
             connection_members = raw_connection.value
+            unit_id = connection_members["id"].value
 
             connection = GenieUnitConnection(unit_id, full_data_set, members=connection_members)
-            full_data_set.unit_connections.update({connection.get_id(): connection})
+            full_data_set.unit_connections[connection.get_id()] = connection
 
     @staticmethod
     def extract_tech_connections(
@@ -413,11 +396,11 @@ class AoCProcessor:
         raw_connections = gamespec[0]["tech_connections"].value
 
         for raw_connection in raw_connections:
-            tech_id = raw_connection["id"].value
             connection_members = raw_connection.value
+            tech_id = connection_members["id"].value
 
             connection = GenieTechConnection(tech_id, full_data_set, members=connection_members)
-            full_data_set.tech_connections.update({connection.get_id(): connection})
+            full_data_set.tech_connections[connection.get_id()] = connection
 
     @staticmethod
     def extract_genie_graphics(gamespec: ArrayMember, full_data_set: GenieObjectContainer) -> None:
@@ -431,20 +414,21 @@ class AoCProcessor:
         raw_graphics = gamespec[0]["graphics"].value
 
         for raw_graphic in raw_graphics:
+            graphic_members = raw_graphic.value
+
             # Can be ignored if there is no filename associated
-            filename = raw_graphic["filename"].value
+            filename = graphic_members["filename"].value
             if not filename:
                 continue
 
-            graphic_id = raw_graphic["graphic_id"].value
-            graphic_members = raw_graphic.value
+            graphic_id = graphic_members["graphic_id"].value
 
             graphic = GenieGraphic(graphic_id, full_data_set, members=graphic_members)
-            slp_id = raw_graphic["slp_id"].value
+            slp_id = graphic_members["slp_id"].value
             if str(slp_id) not in full_data_set.existing_graphics:
                 graphic.exists = False
 
-            full_data_set.genie_graphics.update({graphic.get_id(): graphic})
+            full_data_set.genie_graphics[graphic.get_id()] = graphic
 
         # Detect subgraphics
         for genie_graphic in full_data_set.genie_graphics.values():
@@ -462,11 +446,11 @@ class AoCProcessor:
         raw_sounds = gamespec[0]["sounds"].value
 
         for raw_sound in raw_sounds:
-            sound_id = raw_sound["sound_id"].value
             sound_members = raw_sound.value
+            sound_id = sound_members["sound_id"].value
 
             sound = GenieSound(sound_id, full_data_set, members=sound_members)
-            full_data_set.genie_sounds.update({sound.get_id(): sound})
+            full_data_set.genie_sounds[sound.get_id()] = sound
 
     @staticmethod
     def extract_genie_terrains(gamespec: ArrayMember, full_data_set: GenieObjectContainer) -> None:
@@ -484,7 +468,7 @@ class AoCProcessor:
             terrain_members = raw_terrain.value
 
             terrain = GenieTerrainObject(terrain_index, full_data_set, members=terrain_members)
-            full_data_set.genie_terrains.update({terrain.get_id(): terrain})
+            full_data_set.genie_terrains[terrain.get_id()] = terrain
 
     @staticmethod
     def extract_genie_restrictions(
@@ -507,7 +491,7 @@ class AoCProcessor:
             restriction = GenieTerrainRestriction(restriction_index,
                                                   full_data_set,
                                                   members=restriction_members)
-            full_data_set.genie_terrain_restrictions.update({restriction.get_id(): restriction})
+            full_data_set.genie_terrain_restrictions[restriction.get_id()] = restriction
 
     @staticmethod
     def create_unit_lines(full_data_set: GenieObjectContainer) -> None:
@@ -521,31 +505,40 @@ class AoCProcessor:
         """
         unit_connections = full_data_set.unit_connections
 
-        # First only handle the line heads (firstunits in a line)
+        # Sort the connections into line heads (first units in a line)
+        # and upgrades, so that each is only visited once
+        line_heads = []
+        line_upgrades = []
         for connection in unit_connections.values():
-            unit_id = connection["id"].value
-            unit = full_data_set.genie_units[unit_id]
-            line_mode = connection["line_mode"].value
+            line_mode = connection.members["line_mode"].value
 
-            if line_mode != 2:
-                # It's an upgrade. Skip and handle later
-                continue
+            if line_mode == 2:
+                line_heads.append(connection)
+
+            elif line_mode == 3:
+                line_upgrades.append(connection)
+
+        # First only handle the line heads
+        for connection in line_heads:
+            unit_id = connection.members["id"].value
+            unit = full_data_set.genie_units[unit_id]
+            unit_members = unit.members
 
             # Check for special cases first
-            if unit.has_member("transform_unit_id")\
-                    and unit["transform_unit_id"].value > -1:
+            if "transform_unit_id" in unit_members\
+                    and unit_members["transform_unit_id"].value > -1:
                 # Trebuchet
                 unit_line = GenieUnitTransformGroup(unit_id, unit_id, full_data_set)
-                full_data_set.transform_groups.update({unit_line.get_id(): unit_line})
+                full_data_set.transform_groups[unit_line.get_id()] = unit_line
 
             elif unit_id == 125:
                 # Monks
                 # Switch to monk with relic is hardcoded :(
                 unit_line = GenieMonkGroup(unit_id, unit_id, 286, full_data_set)
-                full_data_set.monk_groups.update({unit_line.get_id(): unit_line})
+                full_data_set.monk_groups[unit_line.get_id()] = unit_line
 
-            elif unit.has_member("task_group")\
-                    and unit["task_group"].value > 0:
+            elif "task_group" in unit_members\
+                    and unit_members["task_group"].value > 0:
                 # Villager
                 # done somewhere else because they are special^TM
                 continue
@@ -555,51 +548,35 @@ class AoCProcessor:
                 unit_line = GenieUnitLineGroup(unit_id, full_data_set)
 
             unit_line.add_unit(unit)
-            full_data_set.unit_lines.update({unit_line.get_id(): unit_line})
-            full_data_set.unit_ref.update({unit_id: unit_line})
+            full_data_set.unit_lines[unit_line.get_id()] = unit_line
+            full_data_set.unit_ref[unit_id] = unit_line
 
         # Second, handle all upgraded units
-        for connection in unit_connections.values():
-            unit_id = connection["id"].value
+        for connection in line_upgrades:
+            connection_members = connection.members
+            unit_id = connection_members["id"].value
             unit = full_data_set.genie_units[unit_id]
-            line_mode = connection["line_mode"].value
-
-            if line_mode != 3:
-                # This unit is not an upgrade and was handled in the last for-loop
-                continue
 
             # Search other_connections for the previous unit in line
-            connected_types = connection["other_connections"].value
-            for index, _ in enumerate(connected_types):
-                connected_type = connected_types[index]["other_connection"].value
-                if connected_type == 2:
-                    # 2 == Unit
-                    connected_index = index
-                    break
-
-            else:
+            # 2 == Unit
+            connected_index = connection.get_first_connection_index(2)
+            if connected_index == -1:
                 raise RuntimeError(f"Unit {unit_id} is not first in line, but no previous "
                                    "unit can be found in other_connections")
 
-            connected_ids = connection["other_connected_ids"].value
+            connected_ids = connection_members["other_connected_ids"].value
             previous_unit_id = connected_ids[connected_index].value
 
             # Search for the first unit ID in the line recursively
             previous_id = previous_unit_id
             previous_connection = unit_connections[previous_unit_id]
-            while previous_connection["line_mode"] != 2:
-                if previous_id in full_data_set.unit_ref.keys():
+            while previous_connection["line_mode"].value != 2:
+                if previous_id in full_data_set.unit_ref:
                     # Short-circuit here, if we the previous unit was already handled
                     break
 
-                connected_types = previous_connection["other_connections"].value
-                connected_index = -1
-                for index, _ in enumerate(connected_types):
-                    connected_type = connected_types[index]["other_connection"].value
-                    if connected_type == 2:
-                        # 2 == Unit
-                        connected_index = index
-                        break
+                # 2 == Unit
+                connected_index = previous_connection.get_first_connection_index(2)
 
                 connected_ids = previous_connection["other_connected_ids"].value
                 previous_id = connected_ids[connected_index].value
@@ -607,7 +584,7 @@ class AoCProcessor:
 
             unit_line = full_data_set.unit_ref[previous_id]
             unit_line.add_unit(unit, after=previous_unit_id)
-            full_data_set.unit_ref.update({unit_id: unit_line})
+            full_data_set.unit_ref[unit_id] = unit_line
 
     @staticmethod
     def create_extra_unit_lines(full_data_set: GenieObjectContainer) -> None:
@@ -624,8 +601,8 @@ class AoCProcessor:
         for unit_id in extra_units:
             unit_line = GenieUnitLineGroup(unit_id, full_data_set)
             unit_line.add_unit(full_data_set.genie_units[unit_id])
-            full_data_set.unit_lines.update({unit_line.get_id(): unit_line})
-            full_data_set.unit_ref.update({unit_id: unit_line})
+            full_data_set.unit_lines[unit_line.get_id()] = unit_line
+            full_data_set.unit_ref[unit_id] = unit_line
 
     @staticmethod
     def create_building_lines(full_data_set: GenieObjectContainer) -> None:
@@ -643,8 +620,10 @@ class AoCProcessor:
         building_connections = full_data_set.building_connections
 
         for connection in building_connections.values():
-            building_id = connection["id"].value
+            connection_members = connection.members
+            building_id = connection_members["id"].value
             building = full_data_set.genie_units[building_id]
+            building_members = building.members
             previous_building_id = None
             stack_building = False
 
@@ -653,12 +632,12 @@ class AoCProcessor:
             line_id = building_id
 
             # Check if we have to create a GenieStackBuildingGroup
-            if building.has_member("stack_unit_id") and \
-                    building["stack_unit_id"].value > -1:
+            if "stack_unit_id" in building_members and \
+                    building_members["stack_unit_id"].value > -1:
                 stack_building = True
 
-            if building.has_member("head_unit_id") and \
-                    building["head_unit_id"].value > -1:
+            if "head_unit_id" in building_members and \
+                    building_members["head_unit_id"].value > -1:
                 # we don't care about head units because we process
                 # them with their stack unit
                 continue
@@ -666,20 +645,14 @@ class AoCProcessor:
             # Check if the building is part of an existing line.
             # To do this, we look for connected techs and
             # check if any tech has an upgrade effect.
-            connected_types = connection["other_connections"].value
-            connected_tech_indices = []
-            for index, _ in enumerate(connected_types):
-                connected_type = connected_types[index]["other_connection"].value
-                if connected_type == 3:
-                    # 3 == Tech
-                    connected_tech_indices.append(index)
-
-            connected_ids = connection["other_connected_ids"].value
+            # 3 == Tech
+            connected_tech_indices = connection.get_connection_indices(3)
+            connected_ids = connection_members["other_connected_ids"].value
 
             for index in connected_tech_indices:
                 connected_tech_id = connected_ids[index].value
                 connected_tech = full_data_set.genie_techs[connected_tech_id]
-                effect_bundle_id = connected_tech["tech_effect_id"].value
+                effect_bundle_id = connected_tech.members["tech_effect_id"].value
                 effect_bundle = full_data_set.genie_effect_bundles[effect_bundle_id]
 
                 upgrade_effects = effect_bundle.get_effects(effect_type=3)
@@ -703,14 +676,9 @@ class AoCProcessor:
                     continue
 
                 # Find the previous building
-                for c_index, _ in enumerate(connected_types):
-                    connected_type = connected_types[c_index]["other_connection"].value
-                    if connected_type == 1:
-                        # 1 == Building
-                        connected_index = c_index
-                        break
-
-                else:
+                # 1 == Building
+                connected_index = connection.get_first_connection_index(1)
+                if connected_index == -1:
                     raise RuntimeError(f"Building {building_id} is not first in line, but no "
                                        "previous building could be found in other_connections")
 
@@ -720,21 +688,21 @@ class AoCProcessor:
             if line_id == building_id:
                 # First building in line
                 if stack_building:
-                    stack_unit_id = building["stack_unit_id"].value
+                    stack_unit_id = building_members["stack_unit_id"].value
                     building_line = GenieStackBuildingGroup(stack_unit_id, line_id, full_data_set)
 
                 else:
                     building_line = GenieBuildingLineGroup(line_id, full_data_set)
 
-                full_data_set.building_lines.update({building_line.get_id(): building_line})
+                full_data_set.building_lines[building_line.get_id()] = building_line
                 building_line.add_unit(building, after=previous_building_id)
-                full_data_set.unit_ref.update({building_id: building_line})
+                full_data_set.unit_ref[building_id] = building_line
 
             else:
                 # It's an upgraded building
                 building_line = full_data_set.building_lines[line_id]
                 building_line.add_unit(building, after=previous_building_id)
-                full_data_set.unit_ref.update({building_id: building_line})
+                full_data_set.unit_ref[building_id] = building_line
 
     @staticmethod
     def sanitize_effect_bundles(full_data_set: GenieObjectContainer) -> None:
@@ -749,29 +717,24 @@ class AoCProcessor:
         effect_bundles = full_data_set.genie_effect_bundles
 
         for bundle in effect_bundles.values():
-            sanitized_effects = {}
-
-            effects = bundle.get_effects()
+            sanitized_effects = []
 
-            index = 0
-            for effect in effects:
-                effect_type = effect["type_id"].value
+            for effect in bundle.effects:
+                effect_members = effect.members
+                effect_type = effect_members["type_id"].value
                 if effect_type < 0:
                     # Effect has no type
                     continue
 
-                if effect_type == 3:
-                    if effect["attr_b"].value < 0:
-                        # Upgrade to invalid unit
-                        continue
+                if effect_type == 3 and effect_members["attr_b"].value < 0:
+                    # Upgrade to invalid unit
+                    continue
 
-                if effect_type == 102:
-                    if effect["attr_d"].value < 0:
-                        # Tech disable effect with no tech id specified
-                        continue
+                if effect_type == 102 and effect_members["attr_d"].value < 0:
+                    # Tech disable effect with no tech id specified
+                    continue
 
-                sanitized_effects.update({index: effect})
-                index += 1
+                sanitized_effects.append(effect)
 
             bundle.effects = sanitized_effects
             bundle.sanitized = True
@@ -791,51 +754,41 @@ class AoCProcessor:
 
         # In tech connection are age ups, building unlocks/upgrades and stat upgrades
         for connection in tech_connections.values():
-            connected_buildings = connection["buildings"].value
-            tech_id = connection["id"].value
+            connection_members = connection.members
+            connected_buildings = connection_members["buildings"].value
+            tech_id = connection_members["id"].value
             tech = full_data_set.genie_techs[tech_id]
 
-            effect_id = tech["tech_effect_id"].value
+            effect_id = tech.members["tech_effect_id"].value
             if effect_id < 0:
                 continue
 
             tech_effects = full_data_set.genie_effect_bundles[effect_id]
 
             # Check if the tech is an age upgrade
-            tech_found = False
-            resource_effects = tech_effects.get_effects(effect_type=1)
-            for effect in resource_effects:
-                # Resource ID 6: Current Age
-                if effect["attr_a"].value != 6:
-                    continue
-
-                age_id = effect["attr_b"].value
+            # Resource ID 6: Current Age
+            age_effect = next((effect for effect in tech_effects.get_effects(effect_type=1)
+                               if effect["attr_a"].value == 6), None)
+            if age_effect is not None:
+                age_id = age_effect["attr_b"].value
                 age_up = AgeUpgrade(tech_id, age_id, full_data_set)
-                full_data_set.tech_groups.update({age_up.get_id(): age_up})
-                full_data_set.age_upgrades.update({age_up.get_id(): age_up})
-                tech_found = True
-                break
-
-            if tech_found:
+                full_data_set.tech_groups[age_up.get_id()] = age_up
+                full_data_set.age_upgrades[age_up.get_id()] = age_up
                 continue
 
             if len(connected_buildings) > 0:
                 # Building unlock or upgrade
                 unlock_effects = tech_effects.get_effects(effect_type=2)
-                upgrade_effects = tech_effects.get_effects(effect_type=2)
                 if len(unlock_effects) > 0:
                     unlock = unlock_effects[0]
                     unlock_id = unlock["attr_a"].value
 
                     building_unlock = BuildingUnlock(tech_id, unlock_id, full_data_set)
-                    full_data_set.tech_groups.update(
-                        {building_unlock.get_id(): building_unlock}
-                    )
-                    full_data_set.building_unlocks.update(
-                        {building_unlock.get_id(): building_unlock}
-                    )
+                    full_data_set.tech_groups[building_unlock.get_id()] = building_unlock
+                    full_data_set.building_unlocks[building_unlock.get_id()] = building_unlock
                     continue
 
+                upgrade_effects = tech_effects.get_effects(effect_type=2)
                 if len(upgrade_effects) > 0:
                     upgrade = upgrade_effects[0]
                     line_id = upgrade["attr_a"].value
@@ -847,32 +800,34 @@ class AoCProcessor:
                         upgrade_id,
                         full_data_set
                     )
-                    full_data_set.tech_groups.update(
-                        {building_upgrade.get_id(): building_upgrade}
-                    )
-                    full_data_set.building_upgrades.update(
-                        {building_upgrade.get_id(): building_upgrade}
-                    )
+                    full_data_set.tech_groups[building_upgrade.get_id()] = building_upgrade
+                    full_data_set.building_upgrades[building_upgrade.get_id()] = building_upgrade
                     continue
 
             # Create a stat upgrade for other techs
             stat_up = StatUpgrade(tech_id, full_data_set)
-            full_data_set.tech_groups.update({stat_up.get_id(): stat_up})
-            full_data_set.stat_upgrades.update({stat_up.get_id(): stat_up})
+            full_data_set.tech_groups[stat_up.get_id()] = stat_up
+            full_data_set.stat_upgrades[stat_up.get_id()] = stat_up
 
         # Unit upgrades and unlocks are stored in unit connections
         unit_connections = full_data_set.unit_connections
         for connection in unit_connections.values():
-            unit_id = connection["id"].value
-            required_research_id = connection["required_research"].value
-            enabling_research_id = connection["enabling_research"].value
-            line_mode = connection["line_mode"].value
-            line_id = full_data_set.unit_ref[unit_id].get_id()
+            connection_members = connection.members
+            line_mode = connection_members["line_mode"].value
+            if line_mode not in (2, 3):
+                # Only line heads (2) and upgrades (3) are unlocked by techs
+                continue
+
+            required_research_id = connection_members["required_research"].value
+            enabling_research_id = connection_members["enabling_research"].value
 
             if required_research_id == -1 and enabling_research_id == -1:
                 # Unit is unlocked from the start
                 continue
 
+            unit_id = connection_members["id"].value
+            line_id = full_data_set.unit_ref[unit_id].get_id()
+
             if line_mode == 2:
                 # Unit is first in line, there should be an unlock tech id
                 # This is usually the enabling tech id
@@ -882,62 +837,63 @@ class AoCProcessor:
                     unlock_tech_id = required_research_id
 
                 unit_unlock = UnitUnlock(unlock_tech_id, line_id, full_data_set)
-                full_data_set.tech_groups.update({unit_unlock.get_id(): unit_unlock})
-                full_data_set.unit_unlocks.update({unit_unlock.get_id(): unit_unlock})
+                full_data_set.tech_groups[unit_unlock.get_id()] = unit_unlock
+                full_data_set.unit_unlocks[unit_unlock.get_id()] = unit_unlock
 
-            elif line_mode == 3:
+            else:
                 # Units further down the line receive line upgrades
                 unit_upgrade = UnitLineUpgrade(required_research_id, line_id,
                                                unit_id, full_data_set)
-                full_data_set.tech_groups.update({unit_upgrade.get_id(): unit_upgrade})
-                full_data_set.unit_upgrades.update({unit_upgrade.get_id(): unit_upgrade})
+                full_data_set.tech_groups[unit_upgrade.get_id()] = unit_upgrade
+                full_data_set.unit_upgrades[unit_upgrade.get_id()] = unit_upgrade
 
         # Initiated techs are stored with buildings
         genie_units = full_data_set.genie_units
 
         for genie_unit in genie_units.values():
-            if not genie_unit.has_member("research_id"):
+            unit_members = genie_unit.members
+            if "research_id" not in unit_members:
                 continue
 
-            building_id = genie_unit["id0"].value
-            initiated_tech_id = genie_unit["research_id"].value
+            building_id = unit_members["id0"].value
+            initiated_tech_id = unit_members["research_id"].value
 
             if initiated_tech_id == -1:
                 continue
 
-            if building_id not in full_data_set.building_lines.keys():
+            if building_id not in full_data_set.building_lines:
                 # Skips upgraded buildings (which initiate the same techs)
                 continue
 
             initiated_tech = InitiatedTech(initiated_tech_id, building_id, full_data_set)
-            full_data_set.tech_groups.update({initiated_tech.get_id(): initiated_tech})
-            full_data_set.initiated_techs.update({initiated_tech.get_id(): initiated_tech})
+            full_data_set.tech_groups[initiated_tech.get_id()] = initiated_tech
+            full_data_set.initiated_techs[initiated_tech.get_id()] = initiated_tech
 
         # Civ boni have to be aquired from techs
         # Civ boni = ONLY passive boni (not unit unlocks, unit upgrades or team bonus)
         genie_techs = full_data_set.genie_techs
 
-        for index, _ in enumerate(genie_techs):
-            tech_id = index
+        for tech_id, tech in genie_techs.items():
+            tech_members = tech.members
 
             # Civ ID must be positive and non-zero
-            civ_id = genie_techs[index]["civilization_id"].value
+            civ_id = tech_members["civilization_id"].value
             if civ_id <= 0:
                 continue
 
             # Passive boni are not researched anywhere
-            research_location_id = genie_techs[index]["research_location_id"].value
+            research_location_id = tech_members["research_location_id"].value
             if research_location_id > 0:
                 continue
 
             # Passive boni are not available in full tech mode
-            full_tech_mode = genie_techs[index]["full_tech_mode"].value
+            full_tech_mode = tech_members["full_tech_mode"].value
             if full_tech_mode:
                 continue
 
             civ_bonus = CivBonus(tech_id, civ_id, full_data_set)
-            full_data_set.tech_groups.update({civ_bonus.get_id(): civ_bonus})
-            full_data_set.civ_boni.update({civ_bonus.get_id(): civ_bonus})
+            full_data_set.tech_groups[civ_bonus.get_id()] = civ_bonus
+            full_data_set.civ_boni[civ_bonus.get_id()] = civ_bonus
 
     @staticmethod
     def create_civ_groups(full_data_set: GenieObjectContainer) -> None:
@@ -951,13 +907,9 @@ class AoCProcessor:
         """
         civ_objects = full_data_set.genie_civs
 
-        for index in range(len(civ_objects)):
-            civ_id = index
-
+        for civ_id in civ_objects:
             civ_group = GenieCivilizationGroup(civ_id, full_data_set)
-            full_data_set.civ_groups.update({civ_group.get_id(): civ_group})
-
-            index += 1
+            full_data_set.civ_groups[civ_group.get_id()] = civ_group
 
     @staticmethod
     def create_villager_groups(full_data_set: GenieObjectContainer) -> None:
@@ -971,26 +923,20 @@ class AoCProcessor:
         :type full_data_set: class: ...dataformat.aoc.genie_object_container.GenieObjectContainer
         """
         units = full_data_set.genie_units
-        task_group_ids = set()
+        task_groups = full_data_set.task_groups
         unit_ids = set()
 
         # Find task groups in the dataset
         for unit in units.values():
-            if unit.has_member("task_group"):
-                task_group_id = unit["task_group"].value
-
-            else:
-                task_group_id = 0
+            task_group_member = unit.members.get("task_group")
+            task_group_id = task_group_member.value if task_group_member is not None else 0
 
             if task_group_id == 0:
                 # no task group
                 continue
 
-            if task_group_id in task_group_ids:
-                task_group = full_data_set.task_groups[task_group_id]
-                task_group.add_unit(unit)
-
-            else:
+            task_group = task_groups.get(task_group_id)
+            if task_group is None:
                 if task_group_id == 1:
                     line_id = GenieUnitTaskGroup.male_line_id
 
@@ -998,18 +944,17 @@ class AoCProcessor:
                     line_id = GenieUnitTaskGroup.female_line_id
 
                 task_group = GenieUnitTaskGroup(line_id, task_group_id, full_data_set)
-                task_group.add_unit(unit)
-                full_data_set.task_groups.update({task_group_id: task_group})
+                task_groups[task_group_id] = task_group
 
-            task_group_ids.add(task_group_id)
+            task_group.add_unit(unit)
             unit_ids.add(unit["id0"].value)
 
         # Create the villager task group
+        task_group_ids = set(task_groups)
         villager = GenieVillagerGroup(118, task_group_ids, full_data_set)
-        full_data_set.unit_lines.update({villager.get_id(): villager})
-        full_data_set.villager_groups.update({villager.get_id(): villager})
-        for unit_id in unit_ids:
-            full_data_set.unit_ref.update({unit_id: villager})
+        full_data_set.unit_lines[villager.get_id()] = villager
+        full_data_set.villager_groups[villager.get_id()] = villager
+        full_data_set.unit_ref.update(dict.fromkeys(unit_ids, villager))
 
     @staticmethod
     def create_ambient_groups(full_data_set: GenieObjectContainer) -> None:
@@ -1023,12 +968,15 @@ class AoCProcessor:
         """
         ambient_ids = AMBIENT_GROUP_LOOKUPS.keys()
         genie_units = full_data_set.genie_units
+        ambient_refs = {}
 
         for ambient_id in ambient_ids:
             ambient_group = GenieAmbientGroup(ambient_id, full_data_set)
             ambient_group.add_unit(genie_units[ambient_id])
-            full_data_set.ambient_groups.update({ambient_group.get_id(): ambient_group})
-            full_data_set.unit_ref.update({ambient_id: ambient_group})
+            full_data_set.ambient_groups[ambient_group.get_id()] = ambient_group
+            ambient_refs[ambient_id] = ambient_group
+
+        full_data_set.unit_ref.update(ambient_refs)
 
     @staticmethod
     def create_variant_groups(full_data_set: GenieObjectContainer) -> None:
@@ -1041,14 +989,18 @@ class AoCProcessor:
         :type full_data_set: class: ...dataformat.aoc.genie_object_container.GenieObjectContainer
         """
         variants = VARIANT_GROUP_LOOKUPS
+        genie_units = full_data_set.genie_units
+        variant_refs = {}
 
         for group_id, variant in variants.items():
             variant_group = GenieVariantGroup(group_id, full_data_set)
-            full_data_set.variant_groups.update({variant_group.get_id(): variant_group})
+            full_data_set.variant_groups[variant_group.get_id()] = variant_group
 
             for variant_id in variant[2]:
-                variant_group.add_unit(full_data_set.genie_units[variant_id])
-                full_data_set.unit_ref.update({variant_id: variant_group})
+                variant_group.add_unit(genie_units[variant_id])
+                variant_refs[variant_id] = variant_group
+
+        full_data_set.unit_ref.update(variant_refs)
 
     @staticmethod
     def create_terrain_groups(full_data_set: GenieObjectContainer) -> None:
@@ -1060,21 +1012,15 @@ class AoCProcessor:
                               process.
         :type full_data_set: class: ...dataformat.aoc.genie_object_container.GenieObjectContainer
         """
-        terrains = full_data_set.genie_terrains.values()
-
-        for terrain in terrains:
-            slp_id = terrain["slp_id"].value
-            replacement_id = terrain["terrain_replacement_id"].value
-
-            if slp_id == -1 and replacement_id == -1:
-                # No graphics and no graphics replacement means this terrain is unused
-                continue
+        terrains = full_data_set.genie_terrains
 
-            enabled = terrain["enabled"].value
-
-            if enabled:
-                terrain_group = GenieTerrainGroup(terrain.get_id(), full_data_set)
-                full_data_set.terrain_groups.update({terrain.get_id(): terrain_group})
+        # No graphics and no graphics replacement means a terrain is unused
+        full_data_set.terrain_groups.update({
+            terrain_id: GenieTerrainGroup(terrain_id, full_data_set)
+            for terrain_id, terrain in terrains.items()
+            if (terrain["slp_id"].value != -1 or terrain["terrain_replacement_id"].value != -1)
+            and terrain["enabled"].value
+        })
 
     @staticmethod
     def link_building_upgrades(full_data_set: GenieObjectContainer) -> None:
@@ -1099,14 +1045,14 @@ class AoCProcessor:
                 upgrade_source_id = effect["attr_a"].value
                 upgrade_target_id = effect["attr_b"].value
 
-                if upgrade_source_id not in full_data_set.building_lines.keys():
+                if upgrade_source_id not in full_data_set.building_lines:
                     continue
 
                 upgraded_line = full_data_set.building_lines[upgrade_source_id]
                 upgrade_target = full_data_set.genie_units[upgrade_target_id]
 
                 upgraded_line.add_unit(upgrade_target)
-                full_data_set.unit_ref.update({upgrade_target_id: upgraded_line})
+                full_data_set.unit_ref[upgrade_target_id] = upgraded_line
 
     @staticmethod
     def link_creatables(full_data_set: GenieObjectContainer) -> None:
@@ -1123,23 +1069,25 @@ class AoCProcessor:
         unit_lines = full_data_set.unit_lines
 
         for unit_line in unit_lines.values():
-            if unit_line.is_creatable():
-                train_location_id = unit_line.get_train_location_id()
+            # Only creatable lines have a train location
+            train_location_id = unit_line.get_train_location_id()
+            if train_location_id is not None:
                 full_data_set.building_lines[train_location_id].add_creatable(unit_line)
 
         # Link buildings to villagers and fishing ships
         building_lines = full_data_set.building_lines
 
         for building_line in building_lines.values():
-            if building_line.is_creatable():
-                train_location_id = building_line.get_train_location_id()
+            train_location_id = building_line.get_train_location_id()
+            if train_location_id is None:
+                continue
 
-                if train_location_id in full_data_set.villager_groups.keys():
-                    full_data_set.villager_groups[train_location_id].add_creatable(building_line)
+            if train_location_id in full_data_set.villager_groups:
+                full_data_set.villager_groups[train_location_id].add_creatable(building_line)
 
-                else:
-                    # try normal units
-                    full_data_set.unit_lines[train_location_id].add_creatable(building_line)
+            else:
+                # try normal units
+                full_data_set.unit_lines[train_location_id].add_creatable(building_line)
 
     @staticmethod
     def link_researchables(full_data_set: GenieObjectContainer) -> None:
@@ -1155,8 +1103,9 @@ class AoCProcessor:
         tech_groups = full_data_set.tech_groups
 
         for tech in tech_groups.values():
-            if tech.is_researchable():
-                research_location_id = tech.get_research_location_id()
+            # Only researchable techs have a research location
+            research_location_id = tech.get_research_location_id()
+            if research_location_id is not None:
                 full_data_set.building_lines[research_location_id].add_researchable(tech)
 
     @staticmethod
@@ -1194,8 +1143,9 @@ class AoCProcessor:
                 full_data_set.civ_groups[enabling_civ_id].add_unique_entity(building_line)
 
         for tech_group in full_data_set.tech_groups.values():
-            if tech_group.is_unique() and tech_group.is_researchable():
-                civ_id = tech_group.get_civilization()
+            # Only unique techs have a civilization
+            civ_id = tech_group.get_civilization()
+            if civ_id is not None and tech_group.is_researchable():
                 full_data_set.civ_groups[civ_id].add_unique_tech(tech_group)
 
     @staticmethod
@@ -1210,18 +1160,28 @@ class AoCProcessor:
         :type full_data_set: class: ...dataformat.aoc.genie_object_container.GenieObjectContainer
         """
         villager_groups = full_data_set.villager_groups
+        building_lines = full_data_set.building_lines
 
-        for villager in villager_groups.values():
-            for unit in villager.variants[0].line:
-                drop_site_members = unit["drop_sites"].value
-                unit_id = unit["id0"].value
+        # Gatherers are the units in the first variant of each villager group
+        gatherer_units = chain.from_iterable(
+            villager.variants[0].line for villager in villager_groups.values()
+        )
+
+        # Gatherer IDs are collected per drop site and added in one go
+        drop_site_gatherers = {}
+        for unit in gatherer_units:
+            unit_members = unit.members
+            drop_site_members = unit_members["drop_sites"].value
+            unit_id = unit_members["id0"].value
+
+            for drop_site_member in drop_site_members:
+                drop_site_id = drop_site_member.value
 
-                for drop_site_member in drop_site_members:
-                    drop_site_id = drop_site_member.value
+                if drop_site_id > -1:
+                    drop_site_gatherers.setdefault(drop_site_id, set()).add(unit_id)
 
-                    if drop_site_id > -1:
-                        drop_site = full_data_set.building_lines[drop_site_id]
-                        drop_site.add_gatherer_id(unit_id)
+        for drop_site_id, gatherer_ids in drop_site_gatherers.items():
+            building_lines[drop_site_id].add_gatherer_ids(gatherer_ids)
 
     @staticmethod
     def link_garrison(full_data_set: GenieObjectContainer) -> None:
@@ -1234,70 +1194,87 @@ class AoCProcessor:
                               process.
         :type full_data_set: class: ...dataformat.aoc.genie_object_container.GenieObjectContainer
         """
-        garrisoned_lines = {}
-        garrisoned_lines.update(full_data_set.unit_lines)
-        garrisoned_lines.update(full_data_set.ambient_groups)
+        garrisoned_lines = chain(full_data_set.unit_lines.values(),
+                                 full_data_set.ambient_groups.values())
 
-        garrison_lines = {}
-        garrison_lines.update(full_data_set.unit_lines)
-        garrison_lines.update(full_data_set.building_lines)
+        garrison_lines = chain(full_data_set.unit_lines.values(),
+                               full_data_set.building_lines.values())
+
+        # Garrison type flags that natural garrisons need for storing
+        # units with a specific creatable type
+        natural_garrison_flags = {
+            1: 0x01,
+            2: 0x02,
+            3: 0x04,
+            6: 0x08,
+        }
+
+        # Garrison mode of every line that can garrison other lines
+        garrisons = [
+            (garrison_line, garrison_line.get_garrison_mode())
+            for garrison_line in garrison_lines
+            if garrison_line.is_garrison()
+        ]
+
+        # Garrisons that can store units of a creatable type;
+        # created on the first unit with this creatable type
+        garrison_candidates = {}
 
         # Search through all units and look at their garrison commands
-        for unit_line in garrisoned_lines.values():
+        for unit_line in garrisoned_lines:
             garrison_classes = []
             garrison_units = []
 
-            if unit_line.has_command(3):
-                unit_commands = unit_line.get_head_unit()["unit_commands"].value
-                for command in unit_commands:
-                    type_id = command["type"].value
-
-                    if type_id != 3:
-                        continue
+            # Look for garrison commands (type 3) of the head unit
+            head_unit = unit_line.get_head_unit()
+            unit_commands = head_unit["unit_commands"].value
+            for command in unit_commands:
+                type_id = command["type"].value
 
-                    class_id = command["class_id"].value
-                    if class_id > -1:
-                        garrison_classes.append(class_id)
+                if type_id != 3:
+                    continue
 
-                        if class_id == 3:
-                            # Towers because Ensemble didn't like consistent rules
-                            garrison_classes.append(52)
+                class_id = command["class_id"].value
+                if class_id > -1:
+                    garrison_classes.append(class_id)
 
-                    unit_id = command["unit_id"].value
-                    if unit_id > -1:
-                        garrison_units.append(unit_id)
+                    if class_id == 3:
+                        # Towers because Ensemble didn't like consistent rules
+                        garrison_classes.append(52)
 
-            for garrison_line in garrison_lines.values():
-                if not garrison_line.is_garrison():
-                    continue
+                unit_id = command["unit_id"].value
+                if unit_id > -1:
+                    garrison_units.append(unit_id)
 
-                # Natural garrison
-                garrison_mode = garrison_line.get_garrison_mode()
-                if garrison_mode == GenieGarrisonMode.NATURAL:
-                    if unit_line.get_head_unit().has_member("creatable_type"):
-                        creatable_type = unit_line.get_head_unit()["creatable_type"].value
+            if head_unit.has_member("creatable_type"):
+                creatable_type = head_unit["creatable_type"].value
 
-                    else:
-                        creatable_type = 0
+            else:
+                creatable_type = 0
 
-                    if garrison_line.get_head_unit().has_member("garrison_type"):
-                        garrison_type = garrison_line.get_head_unit()["garrison_type"].value
+            candidates = garrison_candidates.get(creatable_type)
+            if candidates is None:
+                garrison_flag = natural_garrison_flags.get(creatable_type, 0)
 
-                    else:
-                        garrison_type = 0
+                candidates = []
+                for garrison_line, garrison_mode in garrisons:
+                    if garrison_flag and garrison_mode is GenieGarrisonMode.NATURAL:
+                        if garrison_line.get_head_unit().has_member("garrison_type"):
+                            garrison_type = garrison_line.get_head_unit()["garrison_type"].value
 
-                    if creatable_type == 1 and not garrison_type & 0x01:
-                        continue
+                        else:
+                            garrison_type = 0
 
-                    if creatable_type == 2 and not garrison_type & 0x02:
-                        continue
+                        if not garrison_type & garrison_flag:
+                            continue
 
-                    if creatable_type == 3 and not garrison_type & 0x04:
-                        continue
+                    candidates.append((garrison_line, garrison_mode))
 
-                    if creatable_type == 6 and not garrison_type & 0x08:
-                        continue
+                garrison_candidates[creatable_type] = candidates
 
+            for garrison_line, garrison_mode in candidates:
+                # Natural garrison
+                if garrison_mode is GenieGarrisonMode.NATURAL:
                     if garrison_line.get_class_id() in garrison_classes:
                         unit_line.garrison_locations.append(garrison_line)
                         garrison_line.garrison_entities.append(unit_line)
@@ -1309,20 +1286,20 @@ class AoCProcessor:
                         continue
 
                 # Transports/ unit garrisons (no conditions)
-                elif garrison_mode in (GenieGarrisonMode.TRANSPORT,
-                                       GenieGarrisonMode.UNIT_GARRISON):
+                elif garrison_mode is GenieGarrisonMode.TRANSPORT \
+                        or garrison_mode is GenieGarrisonMode.UNIT_GARRISON:
                     if garrison_line.get_class_id() in garrison_classes:
                         unit_line.garrison_locations.append(garrison_line)
                         garrison_line.garrison_entities.append(unit_line)
 
                 # Self produced units (these cannot be determined from commands)
-                elif garrison_mode == GenieGarrisonMode.SELF_PRODUCED:
+                elif garrison_mode is GenieGarrisonMode.SELF_PRODUCED:
                     if unit_line in garrison_line.creates:
                         unit_line.garrison_locations.append(garrison_line)
                         garrison_line.garrison_entities.append(unit_line)
 
                 # Monk inventories
-                elif garrison_mode == GenieGarrisonMode.MONK:
+                elif garrison_mode is GenieGarrisonMode.MONK:
                     # Search for a pickup command
                     unit_commands = garrison_line.get_head_unit()["unit_commands"].value
                     for command in unit_commands:
@@ -1335,6 +1312,7 @@ class AoCProcessor:
                         if unit_id == unit_line.get_head_unit_id():
                             unit_line.garrison_locations.append(garrison_line)
                             garrison_line.garrison_entities.append(unit_line)
+                            break
 
     @staticmethod
     def link_trade_posts(full_data_set: GenieObjectContainer) -> None:
@@ -1349,22 +1327,20 @@ class AoCProcessor:
         unit_lines = full_data_set.unit_lines.values()
 
         for unit_line in unit_lines:
-            if unit_line.has_command(111):
-                head_unit = unit_line.get_head_unit()
-                unit_commands = head_unit["unit_commands"].value
-                trade_post_id = -1
-                for command in unit_commands:
-                    # Find the trade command and the trade post id
-                    type_id = command["type"].value
-
-                    if type_id != 111:
-                        continue
+            head_unit = unit_line.get_head_unit()
+            unit_commands = head_unit["unit_commands"].value
+            for command in unit_commands:
+                # Find the trade command and the trade post id
+                type_id = command["type"].value
 
-                    trade_post_id = command["unit_id"].value
-                    break
+                if type_id != 111:
+                    continue
+
+                trade_post_id = command["unit_id"].value
 
                 # Notify buiding
                 full_data_set.building_lines[trade_post_id].add_trading_line(unit_line)
+                break
 
     @staticmethod
     def link_repairables(full_data_set: GenieObjectContainer) -> None:
@@ -1378,9 +1354,8 @@ class AoCProcessor:
         """
         villager_groups = full_data_set.villager_groups
 
-        repair_lines = {}
-        repair_lines.update(full_data_set.unit_lines)
-        repair_lines.update(full_data_set.building_lines)
+        repair_lines = chain(full_data_set.unit_lines.values(),
+                             full_data_set.building_lines.values())
 
         repair_classes = []
         for villager in villager_groups.values():
@@ -1404,6 +1379,6 @@ class AoCProcessor:
                 else:
                     repair_classes.append(class_id)
 
-        for repair_line in repair_lines.values():
+        for repair_line in repair_lines:
             if repair_line.get_class_id() in repair_classes:
                 repair_line.repairable = True
@@ -318,7 +318,8 @@ class AoCTechSubprocessor:
 
         except KeyError:
             # TODO: Implement branching line upgrades
-            warn(f"Could not create upgrade from unit {upgrade_source_id} to {upgrade_target_id}")
+            warn("Could not create upgrade from unit %s to %s",
+                 upgrade_source_id, upgrade_target_id)
             return patches
 
         if isinstance(line, GenieBuildingLineGroup):
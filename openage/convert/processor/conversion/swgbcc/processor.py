@@ -257,15 +257,9 @@ class SWGBCCProcessor:
                 continue
 
             # Search other_connections for the previous unit in line
-            connected_types = connection["other_connections"].value
-            for index, _ in enumerate(connected_types):
-                connected_type = connected_types[index]["other_connection"].value
-                if connected_type == 2:
-                    # 2 == Unit
-                    connected_index = index
-                    break
-
-            else:
+            # 2 == Unit
+            connected_index = connection.get_first_connection_index(2)
+            if connected_index == -1:
                 raise ValueError(f"Unit {unit_id} is not first in line, but no previous "
                                  "unit can be found in other_connections")
 
@@ -275,19 +269,13 @@ class SWGBCCProcessor:
             # Search for the first unit ID in the line recursively
             previous_id = previous_unit_id
             previous_connection = unit_connections[previous_unit_id]
-            while previous_connection["line_mode"] != 2:
+            while previous_connection["line_mode"].value != 2:
                 if previous_id in unit_ref:
                     # Short-circuit here, if we the previous unit was already handled
                     break
 
-                connected_types = previous_connection["other_connections"].value
-                connected_index = -1
-                for index, _ in enumerate(connected_types):
-                    connected_type = connected_types[index]["other_connection"].value
-                    if connected_type == 2:
-                        # 2 == Unit
-                        connected_index = index
-                        break
+                # 2 == Unit
+                connected_index = previous_connection.get_first_connection_index(2)
 
                 connected_ids = previous_connection["other_connected_ids"].value
                 previous_id = connected_ids[connected_index].value
@@ -297,39 +285,26 @@ class SWGBCCProcessor:
             unit_line.add_unit(unit, after=previous_unit_id)
 
         # Search for civ lines and attach them to their main line
-        final_unit_lines = {}
-        final_unit_lines.update(unit_lines)
         for line in unit_lines.values():
-            if line.get_head_unit_id() not in CIV_LINE_ASSOCS:
+            head_unit_id = line.get_head_unit_id()
+            ref_line = line
+            if head_unit_id not in CIV_LINE_ASSOCS:
                 for main_head_unit_id, civ_head_unit_ids in CIV_LINE_ASSOCS.items():
-                    if line.get_head_unit_id() in civ_head_unit_ids:
+                    if head_unit_id in civ_head_unit_ids:
                         # The line is an alternative civ line and should be stored
-                        # with the main line only.
-                        main_line = unit_lines[main_head_unit_id]
-                        main_line.add_civ_line(line)
-
-                        # Remove the line from the main reference dict, so that
-                        # it doesn't get converted to a game entity
-                        final_unit_lines.pop(line.get_id())
-
-                        # Store a reference to the main line in the unit ID refs
-                        for unit in line.line:
-                            full_data_set.unit_ref[unit.get_id()] = main_line
-
+                        # with the main line only, so that it doesn't get
+                        # converted to a game entity
+                        ref_line = unit_lines[main_head_unit_id]
+                        ref_line.add_civ_line(line)
                         break
 
-                else:
-                    # Store a reference to the line in the unit ID refs
-                    for unit in line.line:
-                        full_data_set.unit_ref[unit.get_id()] = line
-
-            else:
-                # Store a reference to the line in the unit ID refs
-                for unit in line.line:
-                    full_data_set.unit_ref[unit.get_id()] = line
+            if ref_line is line:
+                # Store the line in the main reference dict
+                full_data_set.unit_lines[line.get_id()] = line
 
-        # Store the remaining lines in the main reference dict
-        full_data_set.unit_lines.update(final_unit_lines)
+            # Store a reference to the line (or its main line) in the unit ID refs
+            for unit in line.line:
+                full_data_set.unit_ref[unit.get_id()] = ref_line
 
     @staticmethod
     def create_extra_unit_lines(full_data_set: GenieObjectContainer) -> None:
@@ -394,7 +369,7 @@ class SWGBCCProcessor:
                     # unlock techs
                     age_up = True
 
-                if effect_type == 2 and unit_id_a in building_connections.keys():
+                if effect_type == 2 and unit_id_a in building_connections:
                     # Unlocks
                     unlocked_by_tech.add(unit_id_a)
 
@@ -404,7 +379,7 @@ class SWGBCCProcessor:
                         full_data_set.building_unlocks.update(
                             {building_unlock.get_id(): building_unlock})
 
-                elif effect_type == 2 and unit_id_a in full_data_set.genie_units.keys():
+                elif effect_type == 2 and unit_id_a in full_data_set.genie_units:
                     # Check if this is a stacked unit (gate or command center)
                     # for these units, we needs the stack_unit_id
                     building = full_data_set.genie_units[unit_id_a]
@@ -419,7 +394,7 @@ class SWGBCCProcessor:
                             full_data_set.building_unlocks.update(
                                 {building_unlock.get_id(): building_unlock})
 
-                if effect_type == 3 and unit_id_b in building_connections.keys():
+                if effect_type == 3 and unit_id_b in building_connections:
                     # Upgrades
                     upgraded_by_tech[unit_id_b] = tech_id
 
@@ -461,15 +436,9 @@ class SWGBCCProcessor:
             building = full_data_set.genie_units[building_id]
 
             # Search other_connections for the previous unit in line
-            connected_types = connection["other_connections"].value
-            for index, _ in enumerate(connected_types):
-                connected_type = connected_types[index]["other_connection"].value
-                if connected_type == 1:
-                    # 1 == Building
-                    connected_index = index
-                    break
-
-            else:
+            # 1 == Building
+            connected_index = connection.get_first_connection_index(1)
+            if connected_index == -1:
                 raise ValueError(f"Building {building_id} is not first in line, but no previous "
                                  "building can be found in other_connections")
 
@@ -479,19 +448,13 @@ class SWGBCCProcessor:
             # Search for the first unit ID in the line recursively
             previous_id = previous_unit_id
             previous_connection = building_connections[previous_unit_id]
-            while previous_connection["line_mode"] != 2:
-                if previous_id in full_data_set.unit_ref.keys():
+            while previous_connection["line_mode"].value != 2:
+                if previous_id in full_data_set.unit_ref:
                     # Short-circuit here, if we the previous unit was already handled
                     break
 
-                connected_types = previous_connection["other_connections"].value
-                connected_index = -1
-                for index, _ in enumerate(connected_types):
-                    connected_type = connected_types[index]["other_connection"].value
-                    if connected_type == 1:
-                        # 1 == Building
-                        connected_index = index
-                        break
+                # 1 == Building
+                connected_index = previous_connection.get_first_connection_index(1)
 
                 connected_ids = previous_connection["other_connected_ids"].value
                 previous_id = connected_ids[connected_index].value
@@ -630,21 +593,14 @@ class SWGBCCProcessor:
             tech_effects = full_data_set.genie_effect_bundles[effect_id]
 
             # Check if the tech is an age upgrade
-            tech_found = False
-            resource_effects = tech_effects.get_effects(effect_type=1)
-            for effect in resource_effects:
-                # Resource ID 6: Current Age
-                if effect["attr_a"].value != 6:
-                    continue
-
-                age_id = effect["attr_b"].value
+            # Resource ID 6: Current Age
+            age_effect = next((effect for effect in tech_effects.get_effects(effect_type=1)
+                               if effect["attr_a"].value == 6), None)
+            if age_effect is not None:
+                age_id = age_effect["attr_b"].value
                 age_up = AgeUpgrade(tech_id, age_id, full_data_set)
                 full_data_set.tech_groups.update({age_up.get_id(): age_up})
                 full_data_set.age_upgrades.update({age_up.get_id(): age_up})
-                tech_found = True
-                break
-
-            if tech_found:
                 continue
 
             # Building unlocks/upgrades are not in SWGB tech connections
@@ -743,7 +699,7 @@ class SWGBCCProcessor:
             if initiated_tech_id == -1:
                 continue
 
-            if building_id not in full_data_set.building_lines.keys():
+            if building_id not in full_data_set.building_lines:
                 # Skips upgraded buildings (which initiate the same techs)
                 continue
 
@@ -754,21 +710,21 @@ class SWGBCCProcessor:
         # Civ boni have to be aquired from techs
         # Civ boni = ONLY passive boni (not unit unlocks, unit upgrades or team bonus)
         genie_techs = full_data_set.genie_techs
-        for index, _ in enumerate(genie_techs):
-            tech_id = index
+        for tech_id, tech in genie_techs.items():
+            tech_members = tech.members
 
             # Civ ID must be positive and non-zero
-            civ_id = genie_techs[index]["civilization_id"].value
+            civ_id = tech_members["civilization_id"].value
             if civ_id <= 0:
                 continue
 
             # Passive boni are not researched anywhere
-            research_location_id = genie_techs[index]["research_location_id"].value
+            research_location_id = tech_members["research_location_id"].value
             if research_location_id > 0:
                 continue
 
             # Passive boni are not available in full tech mode
-            full_tech_mode = genie_techs[index]["full_tech_mode"].value
+            full_tech_mode = tech_members["full_tech_mode"].value
             if full_tech_mode:
                 continue
 
@@ -893,6 +849,7 @@ class SWGBCCProcessor:
                         if unit_id == unit_line.get_head_unit_id():
                             unit_line.garrison_locations.append(garrison_line)
                             garrison_line.garrison_entities.append(unit_line)
+                            break
 
     @staticmethod
     def link_repairables(full_data_set: GenieObjectContainer) -> None:
@@ -367,7 +367,7 @@ class ContainerMember(ValueMember):
         """
         Short command for getting a member in the container.
         """
-        return self.value[key]
+        return self._value[key]
 
     def __len__(self):
         return len(self.value)
@@ -456,23 +456,25 @@ class ArrayMember(ValueMember):
 
         member_dict = {}
         for container in self.value:
-            if key_member_name not in container.value.keys():
+            container_members = container.value
+            key_member = container_members.get(key_member_name)
+            if key_member is None:
                 if force_not_found:
                     continue
 
                 raise KeyError("%s: Container %s has no member called %s"
                                % (self, container, key_member_name))
 
-            key_member_value = container[key_member_name].value
+            key_member_value = key_member.value
 
-            if key_member_value in member_dict.keys():
+            if key_member_value in member_dict:
                 if force_duplicate:
                     continue
 
                 raise KeyError("%s: Duplicate key %s for container member %s"
                                % (self, key_member_value, key_member_name))
 
-            member_dict.update({key_member_value: container})
+            member_dict[key_member_value] = container
 
         return ContainerMember(self.name, member_dict)
 
@@ -520,7 +522,7 @@ class ArrayMember(ValueMember):
         """
         Short command for getting a member in the array.
         """
-        return self.value[key]
+        return self._value[key]
 
     def __len__(self):
         return len(self.value)